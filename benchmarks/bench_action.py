@@ -0,0 +1,168 @@
+"""Benchmark the action end to end on a synthetic notebook repository.
+
+Generates a repository of Markdown notebooks, pushes it to a local bare remote and runs
+the entrypoint against it with stand-in GitHub environment variables, as the action
+would. The time and throughput of each stage come from the timing report of the run.
+No network access is needed.
+
+    python benchmarks/bench_action.py --files 2000 --cells 20 --frontmatter 0.5 --depth 3
+    python benchmarks/bench_action.py --check all --runs 2 --input engine=subprocess-batch
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import subprocess as sp
+
+ENTRYPOINT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'entrypoint.py')
+
+
+def git(*args: str, cwd: str) -> str:
+    """Run a git command as the benchmark user."""
+    command = ['git', '-c', 'user.name=bench', '-c', 'user.email=bench@example.com', *args]
+    return sp.check_output(command, cwd=cwd, text=True).strip()
+
+
+def make_notebook(rng: random.Random, cells: int, frontmatter: bool) -> str:
+    """Make a Markdown notebook with alternating text and code cells."""
+    parts = ['---\nnotebook: true\n---\n'] if frontmatter else []
+    for i in range(cells):
+        if i % 2:
+            lines = [f'x{j} = {rng.randint(0, 1000)} * {j}' for j in range(rng.randint(1, 10))]
+            parts.append('```python\n' + '\n'.join(lines) + '\n```\n')
+        else:
+            words = ' '.join(rng.choice(['notebook', 'cell', 'data', 'plot', 'model']) for _ in range(rng.randint(5, 60)))
+            parts.append(f'## Section {i}\n\n{words.capitalize()}.\n')
+    return '\n'.join(parts)
+
+
+def make_repository(path: str, remote: str, args: argparse.Namespace) -> dict:
+    """Create the repository and its remote, and return the push event of the notebooks."""
+    rng = random.Random(args.seed)
+    sp.check_call(['git', 'init', '-q', '--bare', '-b', 'main', remote])
+    sp.check_call(['git', 'init', '-q', '-b', 'main', path])
+    with open(os.path.join(path, 'README.md'), 'w') as f:
+        f.write('# Benchmark\n')
+    git('add', 'README.md', cwd=path)
+    git('commit', '-q', '-m', 'Initial commit', cwd=path)
+    before = git('rev-parse', 'HEAD', cwd=path)
+
+    for i in range(args.files):
+        # Spread the files over a tree of directories `depth` levels deep
+        parts = [f'd{(i // args.per_dir) % 10 ** (level + 1)}' for level in range(args.depth)]
+        directory = os.path.join(path, 'docs', *parts)
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f'notebook{i}.md'), 'w') as f:
+            f.write(make_notebook(rng, args.cells, rng.random() < args.frontmatter))
+    git('add', 'docs', cwd=path)
+    git('commit', '-q', '-m', 'Add notebooks', cwd=path)
+    after = git('rev-parse', 'HEAD', cwd=path)
+    git('remote', 'add', 'origin', remote, cwd=path)
+    git('push', '-q', 'origin', 'main', cwd=path)
+    return {'before': before, 'after': after, 'commits': []}
+
+
+def run_action(path: str, home: str, event_path: str, report_path: str, args: argparse.Namespace) -> float:
+    """Run the entrypoint in the repository and return its wall time."""
+    env = dict(os.environ)
+    env.update({
+        'HOME': home,
+        'GITHUB_EVENT_NAME': 'push',
+        'GITHUB_EVENT_PATH': event_path,
+        'GITHUB_REPOSITORY': 'owner/repo',
+        'GITHUB_REF': 'refs/heads/main',
+        'GITHUB_HEAD_REF': '',
+        'GITHUB_BASE_REF': '',
+        'GITHUB_ACTOR': 'bench',
+        'GITHUB_REPOSITORY_OWNER': 'owner',
+        'INPUT_GITHUB_TOKEN': '',
+        'INPUT_TARGET_REPOSITORY': '',
+        'INPUT_PULL_REQUEST_REPOSITORY': '',
+        'INPUT_TARGET_BRANCH': '',
+        'INPUT_PULL_REQUEST_BRANCH': '',
+        'INPUT_SYNC_MODE': '',
+        'INPUT_INPUT_FORMAT': '',
+        'INPUT_OUTPUT_FORMAT': '',
+        'INPUT_OUTPUT_DIR': '',
+        'INPUT_COMMIT_MESSAGE': '',
+        'INPUT_CHECK': args.check,
+        'INPUT_INPUT_DIRECTORY': 'docs',
+        'INPUT_REMOTE_URL': os.path.join(os.path.dirname(path), 'remote.git'),
+        'INPUT_REPORT_FILE': report_path,
+    })
+    env.pop('GITHUB_STEP_SUMMARY', None)
+    for item in args.input:
+        name, _, value = item.partition('=')
+        env[f'INPUT_{name.upper()}'] = value
+
+    start = time.perf_counter()
+    result = sp.run([sys.executable, ENTRYPOINT], cwd=path, env=env, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        sys.exit(f"The action failed:\n{result.stdout}\n{result.stderr}")
+    if args.verbose:
+        print(result.stdout)
+    return elapsed
+
+
+def print_report(report_path: str, elapsed: float) -> None:
+    """Print the time and throughput of each stage."""
+    if not os.path.exists(report_path):
+        print(f"No files selected, {elapsed:.2f}s")
+        return
+    with open(report_path) as f:
+        report = json.load(f)
+    files = len(report['files'])
+    megabytes = sum(file['bytes_in'] for file in report['files']) / 1024 / 1024
+    print(f"{'stage':<24}{'time (s)':>10}{'files/s':>12}{'MB/s':>10}")
+    for stage in report['stages']:
+        seconds = stage['seconds']
+        rate = f"{files / seconds:12.1f}{megabytes / seconds:10.2f}" if seconds >= 0.001 else f"{'-':>12}{'-':>10}"
+        print(f"{stage['stage']:<24}{seconds:10.3f}{rate}")
+    print(f"{'total (with startup)':<24}{elapsed:10.3f}{files / elapsed:12.1f}{megabytes / elapsed:10.2f}")
+    print(', '.join(f'{count} {status}' for status, count in sorted(report['counts'].items())),
+          f"({files} files, {megabytes:.1f} MB)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--files', type=int, default=500, help='number of notebooks')
+    parser.add_argument('--cells', type=int, default=20, help='number of cells per notebook')
+    parser.add_argument('--frontmatter', type=float, default=1.0, help='share of notebooks with the frontmatter field')
+    parser.add_argument('--depth', type=int, default=2, help='depth of the directory tree')
+    parser.add_argument('--per-dir', type=int, default=50, help='number of notebooks per directory')
+    parser.add_argument('--check', default='frontmatter', help='check input of the action')
+    parser.add_argument('--runs', type=int, default=1, help='number of runs, later runs find the outputs of the first')
+    parser.add_argument('--input', action='append', default=[], metavar='NAME=VALUE', help='other action input')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the generated content')
+    parser.add_argument('--keep', action='store_true', help='keep and print the benchmark directory')
+    parser.add_argument('--verbose', action='store_true', help='print the output of the action')
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp(prefix='jupytext-bench-')
+    path = os.path.join(tmp_dir, 'repo')
+    start = time.perf_counter()
+    event = make_repository(path, os.path.join(tmp_dir, 'remote.git'), args)
+    print(f"Generated {args.files} notebooks in {time.perf_counter() - start:.1f}s")
+
+    event_path = os.path.join(tmp_dir, 'event.json')
+    with open(event_path, 'w') as f:
+        json.dump(event, f)
+
+    for run in range(args.runs):
+        report_path = os.path.join(tmp_dir, f'report-{run}.json')
+        elapsed = run_action(path, tmp_dir, event_path, report_path, args)
+        print(f"\nRun {run + 1}")
+        print_report(report_path, elapsed)
+
+    if args.keep:
+        print(f"\nBenchmark directory: {tmp_dir}")
+    else:
+        sp.call(['rm', '-rf', tmp_dir])
+
+
+if __name__ == '__main__':
+    main()
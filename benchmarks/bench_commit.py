@@ -0,0 +1,71 @@
+"""Benchmark the porcelain and plumbing commit backends of the entrypoint.
+
+Creates a synthetic repository with many tracked files, changes a few of them, and
+commits them with each backend. Both backends must produce the same tree.
+
+    python benchmarks/bench_commit.py --files 100000 --changed 500
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import subprocess as sp
+
+
+def make_repository(path: str, files: int, per_dir: int) -> None:
+    """Create a repository with `files` tracked files, `per_dir` files per directory."""
+    sp.check_call(['git', 'init', '-q', '-b', 'main', path])
+    for i in range(files):
+        directory = os.path.join(path, f'dir{i // per_dir}')
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f'file{i}.md'), 'w') as f:
+            f.write(f'# File {i}\n')
+    sp.check_call(['git', 'add', '.'], cwd=path)
+    sp.check_call(['git', '-c', 'user.name=bench', '-c', 'user.email=bench@example.com',
+                   'commit', '-q', '-m', 'Initial commit'], cwd=path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--files', type=int, default=20000, help='number of tracked files')
+    parser.add_argument('--changed', type=int, default=200, help='number of files to commit')
+    parser.add_argument('--per-dir', type=int, default=100, help='number of files per directory')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Keep the git configuration of the real home out of the timings
+        os.environ['HOME'] = tmp_dir
+        sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+        import entrypoint
+
+        repository = os.path.join(tmp_dir, 'repo')
+        start = time.perf_counter()
+        make_repository(repository, args.files, args.per_dir)
+        print(f"Created {args.files} files in {time.perf_counter() - start:.1f}s")
+        os.chdir(repository)
+
+        step = max(1, args.files // args.changed)
+        changed = [os.path.join(f'dir{i // args.per_dir}', f'file{i}.md') for i in range(0, args.files, step)]
+        changed = changed[:args.changed]
+
+        trees = {}
+        for backend in ('porcelain', 'plumbing'):
+            sp.check_call(['git', 'reset', '-q', '--hard', 'main' if not trees else 'HEAD~1'])
+            for file in changed:
+                with open(file, 'a') as f:
+                    f.write('Changed\n')
+            config = entrypoint.Config(commit_backend=backend, commit_message='Benchmark commit', actor='bench')
+            start = time.perf_counter()
+            entrypoint.commit_changes(config, changed)
+            elapsed = time.perf_counter() - start
+            trees[backend] = sp.check_output(['git', 'rev-parse', 'HEAD^{tree}'], text=True).strip()
+            print(f"{backend:>9}: {elapsed:.3f}s for {len(changed)} files, tree {trees[backend]}")
+
+        if trees['porcelain'] != trees['plumbing']:
+            sys.exit("The backends produced different trees")
+        print("Both backends produced the same tree")
+
+
+if __name__ == '__main__':
+    main()
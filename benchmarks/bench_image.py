@@ -0,0 +1,123 @@
+"""Benchmark the container image of the action.
+
+Builds the image from the Dockerfile, and from the Dockerfile of a baseline revision
+with --baseline, then reports the size of each image, its compressed size as a proxy of
+the pull size, and the time from `docker run` to the first conversion on a small
+synthetic repository. Needs a local Docker daemon, but no network once the base images
+and packages are available.
+
+    python benchmarks/bench_image.py --baseline HEAD~1 --runs 5
+"""
+import os
+import sys
+import zlib
+import time
+import argparse
+import tempfile
+import statistics
+import subprocess as sp
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+
+def git(*args: str, cwd: str) -> str:
+    """Run a git command as the benchmark user."""
+    command = ['git', '-c', 'user.name=bench', '-c', 'user.email=bench@example.com', *args]
+    return sp.check_output(command, cwd=cwd, text=True).strip()
+
+
+def build_image(tag: str, dockerfile: str) -> float:
+    """Build an image from the repository and return the build time."""
+    start = time.perf_counter()
+    sp.check_call(['docker', 'build', '-q', '-t', tag, '-f', dockerfile, ROOT], stdout=sp.DEVNULL)
+    return time.perf_counter() - start
+
+
+def image_sizes(tag: str) -> tuple:
+    """Get the size of an image and the size of its gzip-compressed layers, in MB."""
+    size = int(sp.check_output(['docker', 'image', 'inspect', '-f', '{{.Size}}', tag], text=True))
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    compressed = 0
+    with sp.Popen(['docker', 'image', 'save', tag], stdout=sp.PIPE) as process:
+        for chunk in iter(lambda: process.stdout.read(1 << 20), b''):
+            compressed += len(compressor.compress(chunk))
+    compressed += len(compressor.flush())
+    return size / 1e6, compressed / 1e6
+
+
+def make_repository(path: str, files: int) -> None:
+    """Create a repository of Markdown notebooks."""
+    sp.check_call(['git', 'init', '-q', '-b', 'main', path])
+    os.makedirs(os.path.join(path, 'docs'))
+    for i in range(files):
+        with open(os.path.join(path, 'docs', f'notebook{i}.md'), 'w') as f:
+            f.write(f'---\nnotebook: true\n---\n\n# Notebook {i}\n\n```python\nprint({i})\n```\n')
+    git('add', '.', cwd=path)
+    git('commit', '-q', '-m', 'Add notebooks', cwd=path)
+
+
+def time_run(tag: str, path: str) -> tuple:
+    """Run the image on a fresh copy of the repository.
+
+    Returns the time to the first conversion and the total time, in seconds.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workspace = os.path.join(tmp_dir, 'workspace')
+        sp.check_call(['cp', '-a', path, workspace])
+        env = {
+            'GITHUB_EVENT_NAME': 'push', 'GITHUB_REPOSITORY': 'owner/repo', 'GITHUB_REF': 'refs/heads/main',
+            'GITHUB_HEAD_REF': '', 'GITHUB_BASE_REF': '', 'GITHUB_ACTOR': 'bench', 'GITHUB_REPOSITORY_OWNER': 'owner',
+            'INPUT_GITHUB_TOKEN': '', 'INPUT_TARGET_REPOSITORY': '', 'INPUT_PULL_REQUEST_REPOSITORY': '',
+            'INPUT_TARGET_BRANCH': '', 'INPUT_PULL_REQUEST_BRANCH': '', 'INPUT_SYNC_MODE': '',
+            'INPUT_INPUT_FORMAT': '', 'INPUT_OUTPUT_FORMAT': '', 'INPUT_OUTPUT_DIR': '', 'INPUT_COMMIT_MESSAGE': '',
+            'INPUT_CHECK': 'all', 'INPUT_INPUT_DIRECTORY': 'docs', 'INPUT_DISABLE_GIT_COMMIT': 'true',
+        }
+        command = ['docker', 'run', '--rm', '-v', f'{workspace}:/github/workspace', '-w', '/github/workspace']
+        for name, value in env.items():
+            command += ['-e', f'{name}={value}']
+        command.append(tag)
+
+        start = time.perf_counter()
+        first_conversion = None
+        with sp.Popen(command, stdout=sp.PIPE, stderr=sp.STDOUT, text=True) as process:
+            for line in process.stdout:
+                if first_conversion is None and line.startswith(('Converting', 'Command:')):
+                    first_conversion = time.perf_counter() - start
+        total = time.perf_counter() - start
+        if process.returncode != 0:
+            sys.exit(f"{tag} failed with exit code {process.returncode}")
+        return first_conversion or total, total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--baseline', help='git revision of the Dockerfile to compare with')
+    parser.add_argument('--runs', type=int, default=5, help='number of runs of each image')
+    parser.add_argument('--files', type=int, default=20, help='number of notebooks in the repository')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        dockerfiles = {}
+        if args.baseline:
+            dockerfiles['baseline'] = os.path.join(tmp_dir, 'Dockerfile.baseline')
+            with open(dockerfiles['baseline'], 'w') as f:
+                f.write(git('show', f'{args.baseline}:Dockerfile', cwd=ROOT))
+        dockerfiles['current'] = os.path.join(ROOT, 'Dockerfile')
+
+        path = os.path.join(tmp_dir, 'repo')
+        make_repository(path, args.files)
+
+        print(f"{'image':<10}{'build (s)':>11}{'size (MB)':>11}{'gzip (MB)':>11}"
+              f"{'first conversion (s)':>22}{'total (s)':>11}")
+        for name, dockerfile in dockerfiles.items():
+            tag = f'jupytext-action-bench:{name}'
+            build_time = build_image(tag, dockerfile)
+            size, compressed = image_sizes(tag)
+            times = [time_run(tag, path) for _ in range(args.runs)]
+            first = statistics.median(first for first, _ in times)
+            total = statistics.median(total for _, total in times)
+            print(f"{name:<10}{build_time:11.1f}{size:11.1f}{compressed:11.1f}{first:22.2f}{total:11.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""Benchmark the startup of the entrypoint on a push that touches no notebook.
+
+Creates a repository whose last commit only changes a README, and times complete runs
+of the entrypoint, which should find nothing to convert. Pass a git revision with
+--baseline to compare with the entrypoint of that revision. Each entrypoint is
+precompiled and run with `python -P -m entrypoint`, as in the action image.
+
+    python benchmarks/bench_startup.py --baseline HEAD~1 --runs 20
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import statistics
+import subprocess as sp
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+
+def git(*args: str, cwd: str) -> str:
+    """Run a git command as the benchmark user."""
+    command = ['git', '-c', 'user.name=bench', '-c', 'user.email=bench@example.com', *args]
+    return sp.check_output(command, cwd=cwd, text=True).strip()
+
+
+def make_repository(path: str, files: int) -> dict:
+    """Create a repository with notebooks, then a commit that changes only the README."""
+    sp.check_call(['git', 'init', '-q', '-b', 'main', path])
+    os.makedirs(os.path.join(path, 'docs'))
+    for i in range(files):
+        with open(os.path.join(path, 'docs', f'notebook{i}.md'), 'w') as f:
+            f.write(f'---\nnotebook: true\n---\n\n# Notebook {i}\n\n```python\nprint({i})\n```\n')
+    with open(os.path.join(path, 'README.md'), 'w') as f:
+        f.write('# Benchmark\n')
+    git('add', '.', cwd=path)
+    git('commit', '-q', '-m', 'Add notebooks', cwd=path)
+    before = git('rev-parse', 'HEAD', cwd=path)
+    with open(os.path.join(path, 'README.md'), 'a') as f:
+        f.write('\nUpdated.\n')
+    git('commit', '-q', '-a', '-m', 'Update README', cwd=path)
+    return {'before': before, 'after': git('rev-parse', 'HEAD', cwd=path), 'commits': []}
+
+
+def install_entrypoint(source: str, directory: str) -> str:
+    """Write an entrypoint module to a directory and precompile it. Returns the directory."""
+    os.makedirs(directory)
+    with open(os.path.join(directory, 'entrypoint.py'), 'w') as f:
+        f.write(source)
+    sp.check_call([sys.executable, '-m', 'compileall', '-q', directory])
+    return directory
+
+
+def time_runs(command: list, path: str, env: dict, runs: int) -> list:
+    """Run a command several times and return the wall times in milliseconds."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        sp.run(command, cwd=path, env=env, check=True, stdout=sp.DEVNULL)
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=20, help='number of runs of each entrypoint')
+    parser.add_argument('--files', type=int, default=100, help='number of notebooks in the repository')
+    parser.add_argument('--check', default='frontmatter', help='check input of the action')
+    parser.add_argument('--baseline', help='git revision of the entrypoint to compare with')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'repo')
+        event_path = os.path.join(tmp_dir, 'event.json')
+        with open(event_path, 'w') as f:
+            json.dump(make_repository(path, args.files), f)
+
+        env = dict(os.environ)
+        env.update({
+            'HOME': tmp_dir,
+            'GITHUB_EVENT_NAME': 'push',
+            'GITHUB_EVENT_PATH': event_path,
+            'GITHUB_REPOSITORY': 'owner/repo',
+            'GITHUB_REF': 'refs/heads/main',
+            'GITHUB_HEAD_REF': '',
+            'GITHUB_BASE_REF': '',
+            'GITHUB_ACTOR': 'bench',
+            'GITHUB_REPOSITORY_OWNER': 'owner',
+            'INPUT_GITHUB_TOKEN': '',
+            'INPUT_TARGET_REPOSITORY': '',
+            'INPUT_PULL_REQUEST_REPOSITORY': '',
+            'INPUT_TARGET_BRANCH': '',
+            'INPUT_PULL_REQUEST_BRANCH': '',
+            'INPUT_SYNC_MODE': '',
+            'INPUT_INPUT_FORMAT': '',
+            'INPUT_OUTPUT_FORMAT': '',
+            'INPUT_OUTPUT_DIR': '',
+            'INPUT_COMMIT_MESSAGE': '',
+            'INPUT_CHECK': args.check,
+            'INPUT_INPUT_DIRECTORY': 'docs',
+        })
+
+        # Name, command and module directory of each run
+        commands = [('python -c pass', [sys.executable, '-c', 'pass'], '')]
+        module_command = [sys.executable, '-P', '-m', 'entrypoint']
+        if args.baseline:
+            source = git('show', f'{args.baseline}:src/entrypoint.py', cwd=ROOT)
+            directory = install_entrypoint(source, os.path.join(tmp_dir, 'baseline'))
+            commands.append((f'entrypoint {args.baseline}', module_command, directory))
+        with open(os.path.join(ROOT, 'src', 'entrypoint.py')) as f:
+            directory = install_entrypoint(f.read(), os.path.join(tmp_dir, 'current'))
+        commands.append(('entrypoint', module_command, directory))
+
+        print(f"{'command':<32}{'min (ms)':>10}{'median (ms)':>13}")
+        for name, command, directory in commands:
+            times = time_runs(command, path, dict(env, PYTHONPATH=directory), args.runs)
+            print(f"{name:<32}{min(times):10.1f}{statistics.median(times):13.1f}")
+
+
+if __name__ == '__main__':
+    main()
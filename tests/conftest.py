@@ -0,0 +1,35 @@
+import os
+import sys
+import subprocess as sp
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+
+def git(*args: str, cwd: str = '.') -> str:
+    """Run a git command and return its output."""
+    return sp.check_output(['git', *args], cwd=cwd, text=True)
+
+
+@pytest.fixture
+def repository(tmp_path, monkeypatch):
+    """A repository with a markdown notebook in docs/, cloned from a bare remote, as working directory."""
+    monkeypatch.setenv('HOME', str(tmp_path))
+    monkeypatch.setenv('GIT_CONFIG_NOSYSTEM', '1')
+    git('config', '--global', 'user.name', 'test')
+    git('config', '--global', 'user.email', 'test@example.com')
+    git('config', '--global', 'init.defaultBranch', 'main')
+    
+    remote = tmp_path / 'remote.git'
+    work = tmp_path / 'work'
+    git('init', '-q', '--bare', str(remote))
+    git('clone', '-q', str(remote), str(work))
+    os.makedirs(work / 'docs')
+    with open(work / 'docs' / 'a.md', 'w') as f:
+        f.write('---\nnotebook: true\n---\n\n# A\n\n```python\n1 + 1\n```\n')
+    git('add', '-A', cwd=str(work))
+    git('commit', '-q', '-m', 'Initial commit', cwd=str(work))
+    git('push', '-q', 'origin', 'HEAD:main', cwd=str(work))
+    monkeypatch.chdir(work)
+    return work
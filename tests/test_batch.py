@@ -0,0 +1,54 @@
+import os
+import json
+
+import pytest
+
+from entrypoint import Config, convert_batch, run_batch_command
+
+NOTEBOOK = '{"cells": [], "metadata": {}, "nbformat": 4, "nbformat_minor": 5}\n'
+
+
+def test_batch_failure_is_mapped_to_its_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs('notebooks')
+    os.makedirs('docs')
+    for name, content in [('a', NOTEBOOK), ('b', 'not a notebook'), ('c', NOTEBOOK)]:
+        with open(f'notebooks/{name}.ipynb', 'w') as f:
+            f.write(content)
+    config = Config(input_format='ipynb', output_format='md', engine='subprocess-batch')
+    pairs = [(f'notebooks/{name}.ipynb', f'docs/{name}.md') for name in 'abc']
+    
+    results = run_batch_command(config, pairs)
+    
+    assert [result['error'] is None for result in results] == [True, False, True]
+    assert [result['changed'] for result in results] == [True, False, True]
+    assert sorted(os.listdir('docs')) == ['a.md', 'c.md']
+    
+    # A second run leaves the outputs alone
+    results = run_batch_command(config, pairs)
+    
+    assert [result['changed'] for result in results] == [False, False, False]
+
+
+@pytest.mark.parametrize('output_format', ['py:light', 'md:myst'])
+def test_batch_output_matches_the_other_engines(tmp_path, monkeypatch, output_format):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs('notebooks')
+    with open('notebooks/a.ipynb', 'w') as f:
+        json.dump({'cells': [{'cell_type': 'markdown', 'id': 'a', 'metadata': {}, 'source': '# A'},
+                             {'cell_type': 'code', 'id': 'b', 'metadata': {}, 'execution_count': None,
+                              'outputs': [], 'source': '1 + 1'}],
+                   'metadata': {}, 'nbformat': 4, 'nbformat_minor': 5}, f)
+    outputs = {}
+    for engine in ['subprocess-batch', 'subprocess', 'python']:
+        config = Config(input_format='ipynb', output_format=output_format, engine=engine)
+        output_file = f'{engine}/a.{config.output_ext}'
+        os.makedirs(engine)
+        
+        result = convert_batch(config, [('notebooks/a.ipynb', output_file)])[0]
+        
+        assert result['error'] is None
+        with open(output_file) as f:
+            outputs[engine] = f.read()
+    
+    assert outputs['subprocess-batch'] == outputs['subprocess'] == outputs['python']
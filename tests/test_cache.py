@@ -0,0 +1,23 @@
+import json
+
+from entrypoint import Config, get_cache_path, restore_from_cache
+
+NOTEBOOK = {'cells': [{'cell_type': 'markdown', 'id': 'a', 'metadata': {}, 'source': '# A'}],
+            'metadata': {}, 'nbformat': 4, 'nbformat_minor': 5}
+
+
+def test_cache_hit_with_other_cell_ids_leaves_the_output_alone(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = Config(cache_dir='cache')
+    cache_path = get_cache_path(config, 'key')
+    tmp_path.joinpath(cache_path).parent.mkdir(parents=True)
+    with open(cache_path, 'w') as f:
+        json.dump(NOTEBOOK, f)
+    existing = json.dumps(dict(NOTEBOOK, cells=[dict(NOTEBOOK['cells'][0], id='b')]))
+    with open('a.ipynb', 'w') as f:
+        f.write(existing)
+    
+    assert restore_from_cache(config, 'key', 'a.ipynb') is False
+    with open('a.ipynb') as f:
+        assert f.read() == existing
+    assert restore_from_cache(config, 'missing', 'a.ipynb') is None
@@ -0,0 +1,59 @@
+import json
+
+from conftest import git
+from entrypoint import Config, get_changed_files
+
+
+def write_event(tmp_path, event) -> str:
+    """Write an event payload and return its path."""
+    path = tmp_path / 'event.json'
+    path.write_text(json.dumps(event))
+    return str(path)
+
+
+def test_push_range_is_diffed_with_renames(repository, tmp_path):
+    before = git('rev-parse', 'HEAD').strip()
+    git('mv', 'docs/a.md', 'docs/b.md')
+    with open('docs/c.md', 'w') as f:
+        f.write('# C\n')
+    git('add', '-A')
+    git('commit', '-q', '-m', 'Rename and add')
+    event = {'before': before, 'after': git('rev-parse', 'HEAD').strip(), 'commits': []}
+    
+    changed = get_changed_files(Config(event_path=write_event(tmp_path, event)))
+    
+    assert sorted(changed) == [('A', 'docs/c.md'), ('R100', 'docs/a.md', 'docs/b.md')]
+
+
+def test_shallow_range_falls_back_to_the_commits_of_the_payload(repository, tmp_path, monkeypatch):
+    before = git('rev-parse', 'HEAD').strip()
+    with open('docs/a.md', 'a') as f:
+        f.write('Changed\n')
+    git('commit', '-q', '-am', 'Change a')
+    git('push', '-q', 'origin', 'main')
+    shallow = str(tmp_path / 'shallow')
+    git('clone', '-q', '--depth', '1', f'file://{tmp_path}/remote.git', shallow)
+    monkeypatch.chdir(shallow)
+    event = {
+        'before': before,
+        'after': git('rev-parse', 'HEAD').strip(),
+        'commits': [
+            {'added': ['docs/b.md'], 'modified': ['docs/a.md'], 'removed': ['docs/c.md']},
+            {'added': ['docs/c.md'], 'modified': [], 'removed': ['docs/b.md']},
+        ],
+    }
+    
+    changed = get_changed_files(Config(event_path=write_event(tmp_path, event)))
+    
+    assert sorted(changed) == [('D', 'docs/b.md'), ('M', 'docs/a.md'), ('M', 'docs/c.md')]
+
+
+def test_missing_payload_falls_back_to_the_last_commit(repository, tmp_path):
+    with open('docs/a.md', 'a') as f:
+        f.write('Changed\n')
+    git('commit', '-q', '-am', 'Change a')
+    event = {'before': '1' * 40, 'after': git('rev-parse', 'HEAD').strip()}
+    
+    changed = get_changed_files(Config(event_path=write_event(tmp_path, event)))
+    
+    assert changed == [('M', 'docs/a.md')]
@@ -0,0 +1,45 @@
+import os
+
+from conftest import git
+from entrypoint import Config, commit_changes
+
+FILES = ['docs/a.md', 'docs/b.md', 'docs/new dir/c.md', 'docs/d.md']
+
+
+def change_files() -> None:
+    """Change, add and remove files of the repository, like a conversion with moves does."""
+    with open('docs/a.md', 'a') as f:
+        f.write('Changed\n')
+    with open('docs/b.md', 'w') as f:
+        f.write('# B\n')
+    os.makedirs('docs/new dir', exist_ok=True)
+    with open('docs/new dir/c.md', 'w') as f:
+        f.write('# C\n')
+    os.remove('docs/d.md')
+
+
+def test_plumbing_commit_matches_porcelain_commit(repository):
+    with open('docs/d.md', 'w') as f:
+        f.write('# D\n')
+    with open('docs/untouched.md', 'w') as f:
+        f.write('# Untouched\n')
+    git('add', '-A')
+    git('commit', '-q', '-m', 'Add files')
+    base = git('rev-parse', 'HEAD').strip()
+    
+    trees = {}
+    for commit_backend in ['porcelain', 'plumbing']:
+        git('reset', '-q', '--hard', base)
+        change_files()
+        
+        assert commit_changes(Config(commit_backend=commit_backend, commit_message='Convert'), FILES)
+        
+        assert git('rev-parse', 'HEAD~1').strip() == base
+        assert git('log', '-1', '--format=%s').strip() == 'Convert'
+        trees[commit_backend] = git('rev-parse', 'HEAD^{tree}').strip()
+    
+    assert trees['plumbing'] == trees['porcelain']
+    # The plumbing backend leaves the index of the working tree alone
+    assert git('diff', '--cached', '--name-only', 'HEAD').split('\n')[:-1] == sorted(FILES)
+    assert git('ls-tree', '-r', '--name-only', 'HEAD', 'docs').split('\n')[:-1] == [
+        'docs/a.md', 'docs/b.md', 'docs/new dir/c.md', 'docs/untouched.md']
@@ -0,0 +1,99 @@
+import re
+import json
+from dataclasses import replace
+
+import pytest
+import yaml
+
+from entrypoint import Config, check_frontmatter, load_frontmatter_index, save_frontmatter_index
+
+
+def baseline_matches(path: str, field: str = 'notebook', value: str = 'true') -> bool:
+    """The frontmatter check of the original action: a regex on the whole file, then a full parse."""
+    with open(path, 'r') as f:
+        content = f.read()
+    frontmatter_match = re.match(r'\A---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
+    if not frontmatter_match:
+        return False
+    frontmatter_text = frontmatter_match.group(1)
+    try:
+        try:
+            if frontmatter_text.strip().startswith('{') and frontmatter_text.strip().endswith('}'):
+                frontmatter = json.loads(frontmatter_text)
+            else:
+                frontmatter = yaml.safe_load(frontmatter_text)
+        except json.JSONDecodeError:
+            frontmatter = yaml.safe_load(frontmatter_text)
+    except yaml.YAMLError:
+        return False
+    expected_value = {'true': True, 'false': False}.get(value.lower(), int(value) if value.isdigit() else value)
+    return isinstance(frontmatter, dict) and bool(frontmatter) and frontmatter.get(field) == expected_value
+
+
+CONTENTS = [
+    '---\nnotebook: true\n---\n# Title\n',
+    '---\nnotebook: false\n---\n',
+    '---\ntitle: A\n---\n',
+    '---\nnotebook: True\n---\n',
+    '---\nnotebook: yes\n---\n',
+    "---\nnotebook: 'true'\n---\n",
+    '---\nnotebook: true # comment\n---\n',
+    '---\nnotebook:   true\ntitle: A\n---\n',
+    '---\nother:\n  notebook: false\nnotebook: true\n---\n',
+    '---\nnotebook: false\nnotebook: true\n---\n',
+    '---\n{"notebook": true}\n---\n',
+    '---\n{"notebook": false}\n---\n',
+    '--- \nnotebook: true\n---  \n',
+    '---\n\nnotebook: true\n---\n',
+    '---\n---\nnotebook: true\n---\n',
+    '---\nnotebook: true\n---\nBody\n---\nnotebook: false\n---\n',
+    '---\r\nnotebook: true\r\n---\r\n',
+    '----\nnotebook: true\n---\n',
+    '--- title\nnotebook: true\n---\n',
+    ' ---\nnotebook: true\n---\n',
+    '\n---\nnotebook: true\n---\n',
+    '---\nnotebook: true\n----\n',
+    '---\nnotebook: true\n---',
+    '---\nnotebook: true\n',
+    '---\nnotebook: [true\n---\n',
+    '---\n- notebook\n---\n',
+    '---\nnotebook: true\ntitle:\tHello\n---\n',
+    '---\nnotebook:\ttrue\n---\n',
+    '---\nnotebook: true\t\n---\n',
+    '---\nnotebook: true\ntags: [a,\tb]\n---\n',
+    '---\nnotebook: true\ntitle: "A\tB"\n---\n',
+    '---\n\n---\n',
+    '# No frontmatter\n',
+    '',
+]
+
+
+@pytest.mark.parametrize('content', CONTENTS)
+def test_frontmatter_check_matches_the_baseline(tmp_path, content):
+    path = tmp_path / 'file.md'
+    path.write_bytes(content.encode())
+    
+    result = check_frontmatter(Config(), str(path))
+    
+    assert bool(result and result[0]) == baseline_matches(str(path))
+
+
+@pytest.mark.parametrize('value', ['false', '1', 'draft'])
+def test_frontmatter_values_match_the_baseline(tmp_path, value):
+    config = Config(frontmatter_value=value)
+    for content in ['---\nnotebook: false\n---\n', '---\nnotebook: 1\n---\n', '---\nnotebook: draft\n---\n',
+                    '---\nnotebook: "1"\n---\n']:
+        path = tmp_path / 'file.md'
+        path.write_text(content)
+        
+        result = check_frontmatter(config, str(path))
+        
+        assert bool(result and result[0]) == baseline_matches(str(path), value=value), content
+
+
+def test_frontmatter_index_is_discarded_when_the_size_limit_changes(tmp_path):
+    config = Config(cache_dir=str(tmp_path))
+    save_frontmatter_index(config, {'blob': [True, True]})
+    
+    assert load_frontmatter_index(config) == {'blob': [True, True]}
+    assert load_frontmatter_index(replace(config, frontmatter_max_bytes=10)) == {}
@@ -0,0 +1,55 @@
+import os
+
+from conftest import git
+from entrypoint import Config, walk_files
+
+GITIGNORE = {
+    '.gitignore': '\n'.join([
+        '# Comment',
+        '/top.md',
+        'ignored*.md',
+        '!ignored-but-kept.md',
+        '**/deep/*.md',
+        'notes/**/tmp',
+        '[ab]x.md',
+        'build/',
+        '!build/kept.md',
+        'question?.md',
+        '\\#hash.md',
+        'trailing.md   ',
+    ]) + '\n',
+    'notes/.gitignore': '\n'.join([
+        '*.md',
+        '!*.keep.md',
+        'sub/',
+        '!/sub2/',
+        '/anchored.keep.md',
+        'nested/*.keep.md',
+    ]) + '\n',
+    'notes/sub2/.gitignore': '!*.md\n',
+}
+
+FILES = [
+    'top.md', 'sub/top.md', 'ignored1.md', 'sub/ignored2.md', 'ignored-but-kept.md',
+    'deep/x.md', 'a/deep/y.md', 'a/deep/er/z.md', 'ax.md', 'bx.md', 'cx.md',
+    'build/b.md', 'build/kept.md', 'sub/build/c.md', 'question1.md', 'question12.md',
+    '#hash.md', 'hash.md', 'trailing.md',
+    'notes/n.md', 'notes/n.keep.md', 'notes/anchored.keep.md', 'notes/sub/anchored.keep.md',
+    'notes/sub/s.keep.md', 'notes/sub2/t.md', 'notes/a/tmp/u.md', 'notes/nested/v.keep.md',
+    'notes/nested/deeper/w.keep.md',
+]
+
+
+def test_walk_matches_git_exclude_standard(repository):
+    for path, content in GITIGNORE.items():
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(content)
+    for path in FILES:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w') as f:
+            f.write('# File\n')
+    
+    expected = git('ls-files', '--cached', '--others', '--exclude-standard', '-z', '--', '*.md').split('\0')[:-1]
+    
+    assert walk_files([Config(input_directory='.')]) == sorted(expected)
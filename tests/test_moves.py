@@ -0,0 +1,37 @@
+import os
+from dataclasses import replace
+
+from conftest import git
+from entrypoint import Config, run
+
+
+def test_only_outputs_recorded_in_the_manifest_are_removed(repository):
+    run(Config(input_directory='docs', check='all', disable_git_commit=True, parallelism=1))
+    with open('docs/b.md', 'w') as f:
+        f.write('# B\n')
+    with open('jupyter/b.ipynb', 'w') as f:
+        f.write('{}\n')
+    git('add', '-A')
+    git('commit', '-q', '-m', 'Add outputs')
+    git('rm', '-q', 'docs/a.md', 'docs/b.md')
+    git('commit', '-q', '-m', 'Remove sources')
+    
+    run(Config(input_directory='docs', check='latest', disable_git_commit=True, parallelism=1))
+    
+    assert not os.path.exists('jupyter/a.ipynb')
+    with open('jupyter/b.ipynb') as f:
+        assert f.read() == '{}\n'
+
+
+def test_outputs_are_removed_without_skip_unchanged(repository):
+    config = Config(input_directory='docs', check='all', skip_unchanged=False, disable_git_commit=True,
+                    parallelism=1)
+    run(config)
+    git('add', '-A')
+    git('commit', '-q', '-m', 'Add outputs')
+    git('rm', '-q', 'docs/a.md')
+    git('commit', '-q', '-m', 'Remove source')
+    
+    run(replace(config, check='latest'))
+    
+    assert not os.path.exists('jupyter/a.ipynb')
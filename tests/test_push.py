@@ -0,0 +1,81 @@
+import os
+
+from conftest import git
+from entrypoint import Config, run
+
+
+def push_upstream(remote: str, tmp_path, file: str) -> None:
+    """Push a commit adding a file to the remote from another clone."""
+    other = str(tmp_path / 'other')
+    git('clone', '-q', remote, other)
+    with open(os.path.join(other, file), 'w') as f:
+        f.write('upstream\n')
+    git('add', '-A', cwd=other)
+    git('commit', '-q', '-m', 'Upstream commit', cwd=other)
+    git('push', '-q', 'origin', 'main', cwd=other)
+
+
+def test_rejected_push_is_rebased_and_keeps_uncommitted_changes(repository, tmp_path):
+    remote = str(tmp_path / 'remote.git')
+    push_upstream(remote, tmp_path, 'upstream.txt')
+    with open('docs/a.md', 'a') as f:
+        f.write('\nUncommitted\n')
+    with open('untracked.txt', 'w') as f:
+        f.write('untracked\n')
+    
+    config = Config(input_directory='docs', check='all', target_branch='main', remote_url=remote,
+                    commit_message='Convert', parallelism=1)
+    run(config)
+    
+    log = git('log', '--format=%s', 'main', cwd=remote).splitlines()
+    assert log == ['Convert', 'Upstream commit', 'Initial commit']
+    assert git('show', 'main:jupyter/a.ipynb', cwd=remote)
+    assert os.path.exists('upstream.txt')
+    with open('docs/a.md') as f:
+        assert f.read().endswith('\nUncommitted\n')
+    with open('untracked.txt') as f:
+        assert f.read() == 'untracked\n'
+
+
+def test_failed_push_is_not_retried(repository, tmp_path, capsys):
+    config = Config(input_directory='docs', check='all', target_branch='main',
+                    remote_url=str(tmp_path / 'missing.git'), push_retries=3, parallelism=1)
+    run(config)
+    
+    output = capsys.readouterr().out
+    assert 'Failed to push changes' in output
+    assert 'retrying' not in output
+
+
+def test_rebase_keeps_the_since_last_marker(repository, tmp_path):
+    remote = str(tmp_path / 'remote.git')
+    with open('docs/b.md', 'w') as f:
+        f.write('# B\n')
+    git('add', '-A')
+    git('commit', '-q', '-m', 'Add b')
+    git('push', '-q', 'origin', 'main')
+    config = Config(input_directory='docs', check='since-last', target_branch='main', remote_url=remote,
+                    commit_message='Convert', parallelism=1)
+    run(config)
+    
+    with open('docs/a.md', 'a') as f:
+        f.write('\nLocal\n')
+    git('commit', '-q', '-am', 'Change a')
+    git('push', '-q', 'origin', 'main')
+    converted = git('rev-parse', 'HEAD').strip()
+    other = str(tmp_path / 'other')
+    git('clone', '-q', remote, other)
+    for name in ('a', 'b'):
+        with open(os.path.join(other, 'docs', f'{name}.md'), 'a') as f:
+            f.write('\nUpstream\n')
+    git('commit', '-q', '-am', 'Change a and b upstream', cwd=other)
+    git('push', '-q', 'origin', 'main', cwd=other)
+    
+    run(config)
+    
+    assert git('show', 'main:jupyter/.jupytext-last-commit', cwd=remote).strip() == converted
+    
+    # The next run converts the file changed upstream
+    run(config)
+    
+    assert 'Upstream' in git('show', 'main:jupyter/b.ipynb', cwd=remote)
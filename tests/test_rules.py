@@ -0,0 +1,18 @@
+import pytest
+
+from entrypoint import Config, convert_files, parse_rules
+
+
+def test_formats_with_a_name_use_the_extension_before_the_colon():
+    rules = Config(rules=parse_rules('py:percent -> ipynb input_directory=scripts check=all')).get_rules()
+    
+    assert (rules[0].input_ext, rules[0].output_ext) == ('py', 'ipynb')
+
+
+def test_rules_writing_the_same_output_are_rejected(repository):
+    with open('docs/a.py', 'w') as f:
+        f.write('1 + 1\n')
+    config = Config(rules=parse_rules('md -> ipynb input_directory=docs\npy -> ipynb input_directory=docs'))
+    
+    with pytest.raises(ValueError, match='both converted to'):
+        convert_files([(rule, [f'docs/a.{rule.input_ext}']) for rule in config.get_rules()])
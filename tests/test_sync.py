@@ -0,0 +1,22 @@
+import json
+
+import pytest
+
+from entrypoint import Config, run
+
+
+@pytest.mark.parametrize('engine', ['python', 'subprocess'])
+def test_changed_output_is_converted_back(repository, engine):
+    config = Config(input_directory='docs', check='all', sync_mode='two-way', engine=engine,
+                    disable_git_commit=True, parallelism=1)
+    run(config)
+    with open('jupyter/a.ipynb') as f:
+        notebook = json.load(f)
+    notebook['cells'][-1]['source'] = '2 + 2'
+    with open('jupyter/a.ipynb', 'w') as f:
+        json.dump(notebook, f)
+    
+    run(config)
+    
+    with open('docs/a.md') as f:
+        assert '2 + 2' in f.read()